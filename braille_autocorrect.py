@@ -1,97 +1,757 @@
 from typing import List, Tuple, Dict
+import bisect
+import functools
 import heapq
 import json
 import os
+import sys
 import time
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+# Optional fast path: batched edit distance in C (pip install numpy rapidfuzz).
+# The pure-Python scan below is used when either package is missing.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from rapidfuzz import process as _rf_process
+    from rapidfuzz.distance import Levenshtein as _rf_Levenshtein
+except ImportError:
+    _rf_process = None
+
+# Optional compiled kernel: `python setup.py build_ext --inplace` produces
+# braille_ext with bit-parallel Myers in C; pure Python remains the fallback.
+try:
+    import braille_ext as _braille_ext
+except ImportError:
+    _braille_ext = None
+
+# Optional JIT path: Numba compiles the distance kernel over uint8 buffers
+# to native code (pip install numba). Falls back to the bit-parallel Python
+# implementation when unavailable.
+try:
+    import numba
+except ImportError:
+    numba = None
+
+if numba is not None and np is not None:
+    @numba.njit(cache=True, nogil=True, boundscheck=False)
+    def _lev_nb(a, b, max_d):
+        """Two-row Levenshtein DP over uint8 buffers; max_d < 0 means uncapped.
+
+        Capped calls only visit the Ukkonen band of cells within max_d of
+        the diagonal — everything outside it costs more than max_d — so the
+        work per row is O(max_d) instead of O(n). Cells just outside the
+        band are marked effectively infinite so the recurrence never reads
+        a stale value.
+        """
+        n, m = a.shape[0], b.shape[0]
+        if n > m:
+            a, b = b, a
+            n, m = m, n
+        prev = np.empty(n + 1, np.int32)
+        cur = np.empty(n + 1, np.int32)
+        big = n + m
+        for j in range(n + 1):
+            prev[j] = j
+        for i in range(1, m + 1):
+            lo = 1
+            hi = n
+            if max_d >= 0:
+                if i - max_d > lo:
+                    lo = i - max_d
+                if i + max_d < hi:
+                    hi = i + max_d
+            cur[lo - 1] = i if lo == 1 else big
+            row_min = cur[lo - 1]
+            bi = b[i - 1]
+            for j in range(lo, hi + 1):
+                cost = prev[j - 1]
+                if a[j - 1] != bi:
+                    cost += 1
+                if prev[j] + 1 < cost:
+                    cost = prev[j] + 1
+                if cur[j - 1] + 1 < cost:
+                    cost = cur[j - 1] + 1
+                cur[j] = cost
+                if cost < row_min:
+                    row_min = cost
+            if max_d >= 0 and row_min > max_d:
+                return max_d + 1
+            if hi < n:
+                cur[hi + 1] = big
+            prev, cur = cur, prev
+        if max_d >= 0 and prev[n] > max_d:
+            # In-band cells whose optimal path leaves the band are inflated,
+            # but only ever past max_d, so the sentinel stays correct.
+            return max_d + 1
+        return prev[n]
+
+    @numba.njit(cache=True, nogil=True, boundscheck=False)
+    def _myers_nb(a, b, max_d):
+        """Myers' bit-parallel distance; pattern a must be 1-64 bytes long.
+
+        The whole DP column lives in the VP/VN machine words, so each text
+        byte costs a fixed handful of uint64 operations instead of a scalar
+        pass over the column. Same early exit and max_d < 0 convention as
+        _lev_nb.
+        """
+        n, m = a.shape[0], b.shape[0]
+        one = np.uint64(1)
+        peq = np.zeros(256, np.uint64)
+        for i in range(n):
+            peq[a[i]] |= one << np.uint64(i)
+        if n == 64:
+            vp = ~np.uint64(0)
+        else:
+            vp = (one << np.uint64(n)) - one
+        vn = np.uint64(0)
+        high = one << np.uint64(n - 1)
+        score = n
+        for j in range(m):
+            x = peq[b[j]] | vn
+            d0 = (((x & vp) + vp) ^ vp) | x
+            hn = vp & d0
+            hp = vn | ~(vp | d0)
+            if hp & high:
+                score += 1
+            elif hn & high:
+                score -= 1
+            x = (hp << one) | one
+            vn = x & d0
+            vp = (hn << one) | ~(x | d0)
+            if max_d >= 0 and score - (m - 1 - j) > max_d:
+                return max_d + 1
+        return score
+
+    @numba.njit(parallel=True, cache=True, nogil=True, boundscheck=False)
+    def _bulk_lev_nb(q, dict_bytes, offsets, out, max_d):
+        """Distance from q to every word in a flat buffer, one word per lane.
+
+        dict_bytes concatenates the braille patterns of offsets.shape[0]-1
+        words; offsets[i]:offsets[i+1] delimits word i. prange spreads the
+        words across cores; capped entries come back as max_d + 1. Queries
+        that fit one machine word (up to 64 pattern chars, i.e. 10 letters)
+        take the bit-parallel kernel; longer ones the two-row DP.
+        """
+        use_myers = 0 < q.shape[0] <= 64
+        for i in numba.prange(offsets.shape[0] - 1):
+            w = dict_bytes[offsets[i]:offsets[i + 1]]
+            if use_myers:
+                out[i] = _myers_nb(q, w, max_d)
+            else:
+                out[i] = _lev_nb(q, w, max_d)
+else:
+    _lev_nb = None
+    _myers_nb = None
+    _bulk_lev_nb = None
+
+# Number of set bits for every 6-bit braille cell; indexing this with the
+# XOR of two cells gives the per-letter substitution cost in dots. A 64-entry
+# table covers unmapped characters (pattern 0) as well, unlike a 26x26
+# letter-indexed table.
+_POPCOUNT6 = tuple(bin(i).count('1') for i in range(64))
+
+# Six dots per cell, packed into the low 6 bits of an int. Module-level so
+# process-pool workers can rebuild patterns without pickling an instance.
+_BRAILLE_MAP = {
+    'a': 0b100000, 'b': 0b110000, 'c': 0b100100, 'd': 0b100110, 'e': 0b100010,
+    'f': 0b110100, 'g': 0b110110, 'h': 0b110010, 'i': 0b010100, 'j': 0b010110,
+    'k': 0b101000, 'l': 0b111000, 'm': 0b101100, 'n': 0b101110, 'o': 0b101010,
+    'p': 0b111100, 'q': 0b111110, 'r': 0b111010, 's': 0b011100, 't': 0b011110,
+    'u': 0b101001, 'v': 0b111001, 'w': 0b010111, 'x': 0b101101, 'y': 0b101111, 'z': 0b101011
+}
+
+# Dictionaries below this size are scanned in-process; the pool only pays
+# off once per-query work dwarfs the chunk pickling overhead.
+_PARALLEL_SCAN_THRESHOLD = 50000
+
+_EXECUTOR = None
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        _EXECUTOR = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _EXECUTOR
+
+def _score_chunk(words: List[str], query_braille: str, max_distance: int) -> List[Tuple[str, int]]:
+    """Pool worker: score one chunk of dictionary words against the query"""
+    results = []
+    for word in words:
+        braille = ''.join(format(_BRAILLE_MAP.get(c, 0), '06b') for c in word)
+        d = _lev_py(query_braille, braille, max_distance)
+        if d <= max_distance:
+            results.append((word, d))
+    return results
+
+def _lev_py(s1: str, s2: str, max_distance: int = None) -> int:
+    """Pure-Python Myers (1999) bit-parallel Levenshtein over strings.
+
+    Bit i of Peq[c] is set when s1[i] == c; the whole DP column lives in
+    the VP/VN bit vectors, so each text character costs a handful of int
+    operations instead of a loop over the column. The module-level form is
+    shared by levenshtein_optimized and the process-pool workers so every
+    scan backend ranks with the same metric.
+    """
+    n, m = len(s1), len(s2)
+    if n > m:
+        s1, s2, n, m = s2, s1, m, n
+    if n == 0:
+        if max_distance is not None and m > max_distance:
+            return max_distance + 1
+        return m
+
+    Peq = {}
+    for i, c in enumerate(s1):
+        Peq[c] = Peq.get(c, 0) | (1 << i)
+
+    all_ones = (1 << n) - 1
+    high_bit = 1 << (n - 1)
+    VP, VN = all_ones, 0
+    score = n
+
+    for j, c in enumerate(s2):
+        X = Peq.get(c, 0) | VN
+        D0 = (((X & VP) + VP) ^ VP) | X
+        HN = VP & D0
+        HP = VN | ~(VP | D0)
+        if HP & high_bit:
+            score += 1
+        elif HN & high_bit:
+            score -= 1
+        X = ((HP << 1) | 1) & all_ones
+        VN = X & D0
+        VP = ((HN << 1) | ~(X | D0)) & all_ones
+
+        # Early termination: score can drop by at most 1 per remaining char
+        if max_distance is not None and score - (m - 1 - j) > max_distance:
+            return max_distance + 1
+
+    return score
+
+def _weighted_edit_distance(p1: Tuple[int, ...], p2: Tuple[int, ...], max_distance: int = None) -> int:
+    """Module-level core of the weighted distance, shared with pool workers"""
+    if max_distance is not None and 6 * abs(len(p1) - len(p2)) > max_distance:
+        return max_distance + 1
+
+    if p1 == p2:
+        return 0
+
+    # Dot-count prefilter: every edit changes the total number of set
+    # dots by at most its own cost, so the difference in dot totals is a
+    # free lower bound on the weighted distance. (The XOR popcount of
+    # the packed patterns is the substitution-only cost, i.e. an upper
+    # bound, and cannot be used to reject candidates.)
+    if max_distance is not None:
+        dots1 = sum(_POPCOUNT6[p] for p in p1)
+        dots2 = sum(_POPCOUNT6[p] for p in p2)
+        if abs(dots1 - dots2) > max_distance:
+            return max_distance + 1
+
+    n, m = len(p1), len(p2)
+    if n > m:
+        p1, p2, n, m = p2, p1, m, n
+    if n == 0:
+        return 6 * m
+
+    prev = [6 * j for j in range(n + 1)]
+    for i in range(1, m + 1):
+        ci = p2[i - 1]
+        cur = [6 * i] + [0] * n
+        row_min = cur[0]
+        for j in range(1, n + 1):
+            cost = prev[j - 1] + _POPCOUNT6[p1[j - 1] ^ ci]
+            if prev[j] + 6 < cost:
+                cost = prev[j] + 6
+            if cur[j - 1] + 6 < cost:
+                cost = cur[j - 1] + 6
+            cur[j] = cost
+            if cost < row_min:
+                row_min = cost
+        if max_distance is not None and row_min > max_distance:
+            return max_distance + 1
+        prev = cur
+    return prev[n]
 
 class BrailleAutoCorrect:
-    def __init__(self, dictionary_file="sample_dictionary.txt", memory_file="memory.json"):
-        self.braille_map = {
-            'a': '100000', 'b': '110000', 'c': '100100', 'd': '100110', 'e': '100010',
-            'f': '110100', 'g': '110110', 'h': '110010', 'i': '010100', 'j': '010110',
-            'k': '101000', 'l': '111000', 'm': '101100', 'n': '101110', 'o': '101010',
-            'p': '111100', 'q': '111110', 'r': '111010', 's': '011100', 't': '011110',
-            'u': '101001', 'v': '111001', 'w': '010111', 'x': '101101', 'y': '101111', 'z': '101011'
-        }
-        
+    def __init__(self, dictionary_file="sample_dictionary.txt", memory_file="memory.jsonl"):
+        self.braille_map = dict(_BRAILLE_MAP)
+        if np is not None:
+            # 128-entry ASCII LUT over the map: building a fresh query's
+            # patterns becomes one indexed load per character instead of a
+            # per-character dict hash, and kernels can take it as an array.
+            self._braille_lut = np.zeros(128, np.uint8)
+            for c, p in self.braille_map.items():
+                self._braille_lut[ord(c)] = p
+
         self.dictionary = self.load_dictionary(dictionary_file)
         self.memory_file = memory_file
+        self._memory_fp = None  # opened lazily, kept open for O(1) appends
         self.user_corrections = self.load_memory()
+
+        # Per-instance caches: repeated queries become a dict lookup instead
+        # of a fresh scan. Cleared whenever corrections or the dictionary change.
+        self.word_to_braille = functools.lru_cache(maxsize=8192)(self.word_to_braille)
+        self._word_patterns = functools.lru_cache(maxsize=8192)(self._word_patterns)
+        self._suggest_cached = functools.lru_cache(maxsize=4096)(self._suggest_impl)
+        self._candidate_lengths = functools.lru_cache(maxsize=1024)(self._candidate_lengths)
         
-        # Optimization: Pre-compute braille patterns and group by length
+        # Optimization: Pre-compute braille patterns and word metadata
         self.braille_words = {}
-        self.words_by_length = defaultdict(list)
         self._preprocess_dictionary()
     
-    def load_dictionary(self, filename: str) -> List[str]:
-        """Load dictionary from file"""
+    def load_dictionary(self, filename: str) -> Tuple[str, ...]:
+        """Load dictionary from file, normalized once: stripped, lowercased
+        and interned so later lookups compare by pointer"""
         try:
             with open(filename, "r") as f:
-                return [line.strip().lower() for line in f.readlines() if line.strip()]
+                return tuple(sys.intern(line.strip().lower()) for line in f.readlines() if line.strip())
         except FileNotFoundError:
             print(f"Warning: {filename} not found. Using default words.")
-            return ["cat", "cap", "bat", "rat", "car", "dog", "can", "help", "hello"]
+            return ("cat", "cap", "bat", "rat", "car", "dog", "can", "help", "hello")
     
     def load_memory(self) -> Dict[str, str]:
-        """Load user correction history"""
-        if os.path.exists(self.memory_file):
+        """Load user correction history.
+
+        The store is append-only JSONL: one {"t": typed, "c": corrected}
+        object per line, later lines overwriting earlier ones. The legacy
+        whole-dict JSON format (and a sibling legacy .json file) are still
+        read, and the file is compacted here when superseded lines have
+        accumulated, so writes stay O(1) per correction.
+        """
+        corrections = {}
+
+        legacy_file = os.path.splitext(self.memory_file)[0] + ".json"
+        if legacy_file != self.memory_file and os.path.exists(legacy_file):
+            try:
+                with open(legacy_file, "r") as f:
+                    corrections.update(json.load(f))
+            except Exception:
+                pass
+
+        if not os.path.exists(self.memory_file):
+            return corrections
+        try:
+            with open(self.memory_file, "r") as f:
+                lines = [line for line in f if line.strip()]
+        except Exception:
+            return corrections
+
+        parsed_all = True
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except Exception:
+                parsed_all = False
+                continue
+            if isinstance(entry, dict) and "t" in entry and "c" in entry:
+                corrections[entry["t"]] = entry["c"]
+            elif isinstance(entry, dict):
+                corrections.update(entry)  # legacy single-line dict
+        if not parsed_all:
+            # Legacy pretty-printed dict spans multiple lines
             try:
                 with open(self.memory_file, "r") as f:
-                    return json.load(f)
-            except:
-                return {}
-        return {}
+                    corrections.update(json.load(f))
+            except Exception:
+                pass
+            self._write_compacted(corrections)
+        elif len(lines) > len(corrections):
+            self._write_compacted(corrections)
+        return corrections
+
+    def _write_compacted(self, corrections: Dict[str, str]):
+        """Rewrite the memory file with one line per surviving correction"""
+        try:
+            with open(self.memory_file, "w") as f:
+                f.write(''.join(json.dumps({"t": t, "c": c}) + "\n"
+                                for t, c in corrections.items()))
+        except Exception as e:
+            print(f"Warning: Could not compact correction memory: {e}")
     
     def _preprocess_dictionary(self):
-        """Pre-compute braille patterns for efficiency"""
+        """Pre-compute braille patterns and build the search indexes.
+
+        Per-word metadata is laid out as parallel arrays (structure of
+        arrays) sorted by braille pattern length: _words[i] and _lens[i]
+        describe row i, and _length_slices maps a pattern length to
+        its (start, end) row range, so any window of lengths is one
+        contiguous slice. Words are interned so repeated lookups compare by
+        pointer.
+        """
+        self.braille_words = {}
+        self._bk_root = None
+        self._stats_cache = None
+        # Set views for O(1) membership tests in the suggest hot path.
+        # Built here, not in __init__, so callers that swap self.dictionary
+        # and reprocess (see suggest_word) never query stale sets.
+        self._dict_set = frozenset(self.dictionary)
+        self._correction_targets = set(self.user_corrections.values())
+        if hasattr(self, '_suggest_cached'):
+            self._suggest_cached.cache_clear()
+            self._candidate_lengths.cache_clear()
+
+        rows = []
         for word in self.dictionary:
+            word = sys.intern(word)
             braille_pattern = self.word_to_braille(word)
             self.braille_words[word] = braille_pattern
-            self.words_by_length[len(braille_pattern)].append(word)
+            rows.append((len(braille_pattern), word))
+            self._bk_insert(word)
+        rows.sort(key=lambda row: row[0])
+
+        self._words = [word for _, word in rows]
+        self._lens = []     # letter counts; braille length is 6x this
+        self._length_slices = {}
+        for i, (length, word) in enumerate(rows):
+            self._lens.append(length // 6)
+            start, _ = self._length_slices.get(length, (i, i))
+            self._length_slices[length] = (start, i + 1)
+        if np is not None:
+            self._lens = np.array(self._lens, dtype=np.int32)
+            # Flat uint8 buffer of all braille patterns in row order, for
+            # the numba bulk kernel; offsets delimit word i's slice. Under
+            # gunicorn the master publishes this buffer in shared memory
+            # before forking (see gunicorn_conf.py) and workers attach to
+            # it instead of each holding a private copy.
+            flat = ''.join(self.braille_words[word] for word in self._words)
+            self._dict_shm = None
+            shm_name = os.environ.get("BRAILLE_DICT_SHM")
+            if shm_name:
+                try:
+                    from multiprocessing import shared_memory
+                    self._dict_shm = shared_memory.SharedMemory(name=shm_name)
+                except Exception:
+                    self._dict_shm = None
+            if self._dict_shm is not None:
+                # Blocks can be page-rounded, so trim to the real length
+                self._dict_bytes = np.frombuffer(
+                    self._dict_shm.buf, np.uint8)[:len(flat)]
+            else:
+                self._dict_bytes = np.frombuffer(flat.encode(), np.uint8)
+            self._dict_offsets = np.zeros(len(self._words) + 1, np.int32)
+            np.cumsum(self._lens * 6, out=self._dict_offsets[1:])
+        self._lengths_sorted = sorted(self._length_slices)
+        self._dawg_root = self._build_dawg()
+        if _bulk_lev_nb is not None and len(self._words) > 0:
+            # Trigger JIT compilation up front so the first query doesn't pay it
+            _bulk_lev_nb(self._dict_bytes[:6], self._dict_bytes,
+                         self._dict_offsets[:2], np.empty(1, np.int32), 0)
+
+    def _bk_insert(self, word: str):
+        """Insert a word into the BK-tree keyed on pattern-string distance"""
+        braille = self.word_to_braille(word)
+        if self._bk_root is None:
+            self._bk_root = [word, braille, {}]
+            return
+        node = self._bk_root
+        while True:
+            d = _lev_py(braille, node[1])
+            if d == 0:
+                return  # identical pattern already indexed
+            child = node[2].get(d)
+            if child is None:
+                node[2][d] = [word, braille, {}]
+                return
+            node = child
+
+    def _build_dawg(self):
+        """Minimal acyclic automaton (DAWG) over the dictionary.
+
+        A trie is built first, then equivalent subtrees are merged bottom-up
+        through a registry, so words sharing prefixes or suffixes share
+        nodes. Nodes are [is_final, edges] lists like the BK-tree's.
+        """
+        root = [False, {}]
+        for word in sorted(set(self.dictionary)):
+            node = root
+            for letter in word:
+                node = node[1].setdefault(letter, [False, {}])
+            node[0] = True
+
+        register = {}
+
+        def minimize(node):
+            for letter, child in node[1].items():
+                node[1][letter] = minimize(child)
+            key = (node[0], tuple(sorted((l, id(c)) for l, c in node[1].items())))
+            return register.setdefault(key, node)
+
+        return minimize(root)
+
+    def _dawg_search(self, input_word: str, max_distance: int, max_results: int = None) -> List[Tuple[str, int]]:
+        """All (word, distance) pairs within max_distance of the query.
+
+        Walks the DAWG carrying one DP row per node over the query's braille
+        pattern string — the same unit-cost metric the rapidfuzz, C and
+        numba backends use — so every word sharing a prefix reuses the rows
+        computed for that prefix instead of restarting the DP from scratch.
+        Each edge advances the row by the letter's six pattern characters.
+        Row minimums only grow as a prefix is extended, so a subtree whose
+        row minimum already exceeds the bound is pruned whole. When
+        max_results is given the bound shrinks to the k-th best distance
+        seen so far (branch and bound); words beyond it cannot reach the
+        top k, so only ties and better distances are collected once k
+        results exist.
+        """
+        braille = self.word_to_braille(input_word)
+        n = len(braille)
+        # One substitution-cost column per pattern character value, computed
+        # up front and shared by every edge during the walk, plus each
+        # letter's six columns in expansion order.
+        char_col = {c: tuple(int(ch != c) for ch in braille) for c in ('0', '1')}
+        letter_cols = {letter: [char_col[c] for c in format(cp, '06b')]
+                       for letter, cp in self.braille_map.items()}
+        default_cols = [char_col['0']] * 6  # unmapped letters expand to 000000
+        bound = max_distance
+        best_heap = []  # max-heap (negated) of the best max_results distances
+        results = []
+        stack = [(self._dawg_root, '', list(range(n + 1)))]
+        while stack:
+            node, prefix, row = stack.pop()
+            if node[0] and row[n] <= bound:
+                results.append((prefix, row[n]))
+                if max_results is not None:
+                    heapq.heappush(best_heap, -row[n])
+                    if len(best_heap) > max_results:
+                        heapq.heappop(best_heap)
+                    if len(best_heap) == max_results and -best_heap[0] < bound:
+                        bound = -best_heap[0]
+            for letter, child in node[1].items():
+                cols = letter_cols.get(letter, default_cols)
+                r = row
+                for col in cols:
+                    new_row = [r[0] + 1]
+                    row_min = new_row[0]
+                    for j in range(1, n + 1):
+                        cost = r[j - 1] + col[j - 1]
+                        if r[j] + 1 < cost:
+                            cost = r[j] + 1
+                        if new_row[j - 1] + 1 < cost:
+                            cost = new_row[j - 1] + 1
+                        new_row.append(cost)
+                        if cost < row_min:
+                            row_min = cost
+                    r = new_row
+                if row_min <= bound:
+                    stack.append((child, prefix + letter, r))
+        return results
+
+    def _bk_nearest(self, input_word: str) -> Tuple[str, int]:
+        """Closest dictionary word with no distance cap (branch-and-bound)"""
+        braille = self.word_to_braille(input_word)
+        best_word, best_d = None, None
+        stack = [self._bk_root]
+        while stack:
+            word, node_braille, children = stack.pop()
+            d = _lev_py(braille, node_braille)
+            if best_d is None or d < best_d:
+                best_word, best_d = word, d
+            for key, child in children.items():
+                if abs(key - d) <= best_d:
+                    stack.append(child)
+        return best_word, best_d
     
     def word_to_braille(self, word: str) -> str:
         """Convert word to braille pattern"""
-        return ''.join(self.braille_map.get(c.lower(), '000000') for c in word)
-    
+        return ''.join(format(self.braille_map.get(c.lower(), 0), '06b') for c in word)
+
+    def _word_patterns(self, word: str) -> Tuple[int, ...]:
+        """Word as a tuple of 6-bit cell patterns, one per letter"""
+        if np is not None:
+            # 'replace' keeps one byte per character, and the LUT maps the
+            # substitute (and any unmapped character) to pattern 0
+            cells = self._braille_lut[np.frombuffer(
+                word.lower().encode('ascii', 'replace'), np.uint8) & 0x7F]
+            return tuple(map(int, cells))
+        return tuple(self.braille_map.get(c.lower(), 0) for c in word)
+
+    def levenshtein_weighted(self, word1: str, word2: str, max_distance: int = None) -> int:
+        """Letter-level edit distance in braille-dot units.
+
+        Substituting one letter costs the number of dots that differ between
+        the two cells (0-6); inserting or deleting a letter costs a full cell
+        of 6, so results stay comparable to the pattern-string distance while
+        the DP runs over letters instead of 6x as many pattern characters.
+        """
+        return self._weighted_distance(self._word_patterns(word1),
+                                       self._word_patterns(word2), max_distance)
+
+    def _weighted_distance(self, p1: Tuple[int, ...], p2: Tuple[int, ...], max_distance: int = None) -> int:
+        return _weighted_edit_distance(p1, p2, max_distance)
+
     def levenshtein_optimized(self, s1: str, s2: str, max_distance: int = None) -> int:
-        """Optimized Levenshtein distance with early termination"""
-        if abs(len(s1) - len(s2)) > (max_distance or float('inf')):
-            return max_distance + 1 if max_distance else abs(len(s1) - len(s2))
-        
-        n, m = len(s1), len(s2)
-        if n > m:
-            s1, s2, n, m = s2, s1, m, n
-        
-        current_row = list(range(n + 1))
-        for i in range(1, m + 1):
-            previous_row, current_row = current_row, [i] + [0] * n
-            for j in range(1, n + 1):
-                add, delete, change = previous_row[j] + 1, current_row[j - 1] + 1, previous_row[j - 1]
-                if s1[j - 1] != s2[i - 1]:
-                    change += 1
-                current_row[j] = min(add, delete, change)
-            
-            # Early termination if all values exceed threshold
-            if max_distance and min(current_row) > max_distance:
-                return max_distance + 1
-        
-        return current_row[n]
-    
+        """Bit-parallel Levenshtein distance (Myers 1999) with early termination"""
+        if max_distance is not None and abs(len(s1) - len(s2)) > max_distance:
+            return max_distance + 1
+
+        # Dot-count prefilter: a single edit changes the number of set dots
+        # by at most one, so the popcount difference is a lower bound on the
+        # distance (the raw Hamming distance would only be an upper bound).
+        if max_distance is not None and abs(s1.count('1') - s2.count('1')) > max_distance:
+            return max_distance + 1
+
+        if s1 == s2:
+            return 0
+
+        if _braille_ext is not None:
+            return _braille_ext.levenshtein(s1.encode(), s2.encode(),
+                                            -1 if max_distance is None else max_distance)
+
+        if _lev_nb is not None:
+            a = np.frombuffer(s1.encode(), np.uint8)
+            b = np.frombuffer(s2.encode(), np.uint8)
+            if a.shape[0] > b.shape[0]:
+                a, b = b, a
+            kernel = _myers_nb if 0 < a.shape[0] <= 64 else _lev_nb
+            return int(kernel(a, b, -1 if max_distance is None else max_distance))
+
+        return _lev_py(s1, s2, max_distance)
+
+
+    def _attach_confidences(self, matches: List[Tuple[str, int]], input_len: int) -> List[Tuple[str, int, float]]:
+        """Turn (word, distance) matches into (word, distance, confidence)"""
+        suggestions = []
+        for word, distance in matches:
+            # Improved confidence: based on combined length, not just max()
+            confidence = 1.0 - (distance / (input_len + 6 * len(word)))
+
+            # Bonus if it's a learned correction
+            if word in self._correction_targets:
+                confidence += 0.1
+
+            suggestions.append((word, distance, round(confidence, 3)))
+        return suggestions
+
+    def _scan_dawg(self, input_word: str, input_len: int, max_distance: int,
+                   max_suggestions: int = None) -> List[Tuple[str, int, float]]:
+        """Collect matches from the DAWG and attach confidence scores"""
+        matches = self._dawg_search(input_word, max_distance, max_suggestions)
+        return self._attach_confidences(matches, input_len)
+
+    def _scan_ext(self, input_braille: str, input_len: int, max_distance: int) -> List[Tuple[str, int, float]]:
+        """Score the candidate window in one C call via braille_ext"""
+        lengths = self._candidate_lengths(input_len, max_distance)
+        if not lengths:
+            return []
+        start = self._length_slices[lengths[0]][0]
+        end = self._length_slices[lengths[-1]][1]
+        words = self._words[start:end]
+        brailles = [self.braille_words[word].encode() for word in words]
+        dists = _braille_ext.batch_distances(input_braille.encode(), brailles, max_distance)
+        return self._attach_confidences(
+            [(word, d) for word, d in zip(words, dists) if d <= max_distance], input_len)
+
+    def _scan_numba(self, input_braille: str, input_len: int, max_distance: int,
+                    max_suggestions: int = None) -> List[Tuple[str, int, float]]:
+        """Score the candidate window with the parallel numba kernel"""
+        lengths = self._candidate_lengths(input_len, max_distance)
+        if not lengths:
+            return []
+        start = self._length_slices[lengths[0]][0]
+        end = self._length_slices[lengths[-1]][1]
+        q = np.frombuffer(input_braille.encode(), np.uint8)
+        dists = np.empty(end - start, np.int32)
+        _bulk_lev_nb(q, self._dict_bytes, self._dict_offsets[start:end + 1],
+                     dists, max_distance)
+        keep = np.flatnonzero(dists <= max_distance)
+        keep = self._topk_by_distance(dists, keep, max_suggestions)
+        return self._attach_confidences(
+            [(self._words[start + i], int(dists[i])) for i in keep], input_len)
+
+    @staticmethod
+    def _topk_by_distance(dists, keep, max_suggestions):
+        """Shrink a survivor index array to the top k distances plus ties.
+
+        argpartition finds the k-th smallest distance in one O(N) pass;
+        keeping everything at or below it (rather than exactly k rows)
+        preserves equal-distance candidates so the confidence tiebreak
+        downstream still sees them. Only the surviving rows are ever
+        materialized as Python tuples.
+        """
+        if max_suggestions is None or keep.size <= max_suggestions:
+            return keep
+        kth = np.partition(dists[keep], max_suggestions - 1)[max_suggestions - 1]
+        return keep[dists[keep] <= kth]
+
+    def _scan_parallel(self, input_word: str, input_len: int, max_distance: int) -> List[Tuple[str, int, float]]:
+        """Fan the candidate window out across a process pool, one chunk per core"""
+        lengths = self._candidate_lengths(input_len, max_distance)
+        if not lengths:
+            return []
+        start = self._length_slices[lengths[0]][0]
+        end = self._length_slices[lengths[-1]][1]
+        words = self._words[start:end]
+
+        workers = os.cpu_count() or 1
+        chunk_size = (len(words) + workers - 1) // workers
+        chunks = [words[i:i + chunk_size] for i in range(0, len(words), chunk_size)]
+        score = functools.partial(_score_chunk,
+                                  query_braille=self.word_to_braille(input_word),
+                                  max_distance=max_distance)
+        matches = [match for part in _get_executor().map(score, chunks) for match in part]
+        return self._attach_confidences(matches, input_len)
+
+    def _candidate_lengths(self, input_len: int, max_distance: int) -> Tuple[int, ...]:
+        """Populated braille lengths within max_distance of the query's length"""
+        lo = bisect.bisect_left(self._lengths_sorted, input_len - max_distance)
+        hi = bisect.bisect_right(self._lengths_sorted, input_len + max_distance)
+        return tuple(self._lengths_sorted[lo:hi])
+
+    def _scan_vectorized(self, input_braille: str, candidates: List[str], max_distance: int,
+                         max_suggestions: int = None) -> List[Tuple[str, int, float]]:
+        """Score all candidates in one rapidfuzz C call, then filter in NumPy"""
+        if not candidates:
+            return []
+        cand_brailles = [self.braille_words[word] for word in candidates]
+        dists = _rf_process.cdist(
+            [input_braille], cand_brailles,
+            scorer=_rf_Levenshtein.distance,
+            score_cutoff=max_distance,
+            dtype=np.int32,
+        )[0]
+
+        keep = np.flatnonzero(dists <= max_distance)
+        if keep.size == 0:
+            return []
+        keep = self._topk_by_distance(dists, keep, max_suggestions)
+
+        input_len = len(input_braille)
+        cand_lens = np.fromiter((len(cand_brailles[i]) for i in keep), np.int32, keep.size)
+        confidences = 1.0 - dists[keep] / (input_len + cand_lens)
+
+        learned = self._correction_targets
+        return [(candidates[i],
+                 int(dists[i]),
+                 round(float(conf) + (0.1 if candidates[i] in learned else 0.0), 3))
+                for i, conf in zip(keep, confidences)]
 
     def suggest_words(self, input_word: str, max_suggestions: int = 5, max_distance: int = None) -> List[Tuple[str, int, float]]:
         """
         Suggest words with confidence scores
         Returns: List of (word, distance, confidence_score)
         """
-        input_word = input_word.lower()
+        # Normalize once at entry; interning makes the set membership checks
+        # below pointer comparisons against the interned dictionary words.
+        return list(self._suggest_cached(sys.intern(input_word.strip().lower()),
+                                         max_suggestions, max_distance))
+
+    def _suggest_impl(self, input_word: str, max_suggestions: int, max_distance: int) -> Tuple[Tuple[str, int, float], ...]:
+        """Uncached body of suggest_words; results are memoized per instance"""
 
         # Check learned corrections first
         if input_word in self.user_corrections:
             learned_word = self.user_corrections[input_word]
-            if learned_word in self.dictionary:
-                return [(learned_word, 0, 1.0)]
-        
+            if learned_word in self._dict_set:
+                return ((learned_word, 0, 1.0),)
+
+        # Exact dictionary words need no scan at all
+        if input_word in self._dict_set:
+            return ((input_word, 0, 1.0),)
+
         input_braille = self.word_to_braille(input_word)
         input_len = len(input_braille)
 
@@ -104,58 +764,64 @@ class BrailleAutoCorrect:
             else:
                 max_distance = 4
 
-        suggestions = []
-        search_lengths = [input_len]
-        for i in range(1, max_distance + 1):
-            if input_len - i > 0:
-                search_lengths.append(input_len - i)
-            search_lengths.append(input_len + i)
-
-        for length in search_lengths:
-            if length in self.words_by_length:
-                for word in self.words_by_length[length]:
-                    word_braille = self.braille_words[word]
-                    distance = self.levenshtein_optimized(input_braille, word_braille, max_distance)
-
-                    if distance <= max_distance:
-                        # Improved confidence: based on combined length, not just max()
-                        confidence = 1.0 - (distance / (len(input_braille) + len(word_braille)))
-
-                        # Bonus if it's a learned correction
-                        if word in self.user_corrections.values():
-                            confidence += 0.1
-                        
-                        suggestions.append((word, distance, round(confidence, 3)))
-
-        # Sort: lowest distance, then highest confidence
-        suggestions.sort(key=lambda x: (x[1], -x[2]))
+        if _rf_process is not None and np is not None:
+            lengths = self._candidate_lengths(input_len, max_distance)
+            if lengths:
+                # Rows are length-sorted, so the whole window is one slice
+                start = self._length_slices[lengths[0]][0]
+                end = self._length_slices[lengths[-1]][1]
+                candidates = self._words[start:end]
+            else:
+                candidates = []
+            suggestions = self._scan_vectorized(input_braille, candidates, max_distance,
+                                                max_suggestions)
+        elif _braille_ext is not None:
+            suggestions = self._scan_ext(input_braille, input_len, max_distance)
+        elif _bulk_lev_nb is not None:
+            suggestions = self._scan_numba(input_braille, input_len, max_distance,
+                                           max_suggestions)
+        elif len(self._words) >= _PARALLEL_SCAN_THRESHOLD:
+            suggestions = self._scan_parallel(input_word, input_len, max_distance)
+        else:
+            suggestions = self._scan_dawg(input_word, input_len, max_distance, max_suggestions)
 
-        # Fallback: if no results, return top closest even if over distance
-        if not suggestions:
-            fallback = [(word, self.levenshtein_optimized(input_braille, braille), 0.0)
-                        for word, braille in self.braille_words.items()]
-            fallback.sort(key=lambda x: x[1])
-            return fallback[:1]
+        # Fallback: if no results, return the closest word even if over distance
+        if not suggestions and self._bk_root is not None:
+            word, distance = self._bk_nearest(input_word)
+            return ((word, distance, 0.0),)
 
-        return suggestions[:max_suggestions]
+        # Top-k selection: lowest distance, then highest confidence, with the
+        # word as a final tiebreak so full ties rank identically no matter
+        # which scan backend produced them. nsmallest is O(N log k) and skips
+        # sorting matches that are never returned.
+        return tuple(heapq.nsmallest(max_suggestions, suggestions,
+                                     key=lambda x: (x[1], -x[2], x[0])))
 
 
     def remember_choice(self, typed: str, corrected: str):
-        """Store user correction for learning"""
-        self.user_corrections[typed.lower()] = corrected.lower()
+        """Store user correction for learning (one appended line per choice)"""
+        typed, corrected = typed.lower(), corrected.lower()
+        self.user_corrections[typed] = corrected
+        self._correction_targets.add(corrected)
+        self._stats_cache = None
+        self._suggest_cached.cache_clear()
         try:
-            with open(self.memory_file, "w") as f:
-                json.dump(self.user_corrections, f, indent=2)
+            if self._memory_fp is None or self._memory_fp.closed:
+                self._memory_fp = open(self.memory_file, "a")
+            self._memory_fp.write(json.dumps({"t": typed, "c": corrected}) + "\n")
+            self._memory_fp.flush()
         except Exception as e:
             print(f"Warning: Could not save correction memory: {e}")
     
     def get_stats(self) -> Dict:
-        """Get system statistics"""
-        return {
-            "dictionary_size": len(self.dictionary),
-            "learned_corrections": len(self.user_corrections),
-            "braille_patterns_cached": len(self.braille_words)
-        }
+        """Get system statistics (cached; rebuilt after changes)"""
+        if self._stats_cache is None:
+            self._stats_cache = {
+                "dictionary_size": len(self.dictionary),
+                "learned_corrections": len(self.user_corrections),
+                "braille_patterns_cached": len(self.braille_words)
+            }
+        return self._stats_cache
 
 def run_tests():
     """Test cases to demonstrate system effectiveness"""
@@ -240,18 +906,38 @@ def main():
         else:
             print("No suggestions found. Try a different input.")
 
-# Backward compatibility functions for existing code
+# Backward compatibility functions for existing code. Instances are cached
+# so repeated calls reuse the preprocessed tables instead of re-reading the
+# dictionary and rebuilding the indexes per call.
+_DEFAULT_CORRECTOR = None
+_suggest_corrector_cache = {}
+
+def _default_corrector() -> "BrailleAutoCorrect":
+    """Lazily constructed shared instance for the no-argument paths"""
+    global _DEFAULT_CORRECTOR
+    if _DEFAULT_CORRECTOR is None:
+        _DEFAULT_CORRECTOR = BrailleAutoCorrect()
+    return _DEFAULT_CORRECTOR
+
 def load_dictionary(filename="sample_dictionary.txt") -> List[str]:
-    """Backward compatibility function"""
-    corrector = BrailleAutoCorrect(filename)
-    return corrector.dictionary
+    """Backward compatibility function. The corrector stores its dictionary
+    as a tuple, but legacy callers expect (and may mutate) a list, so hand
+    out a fresh copy."""
+    if filename == "sample_dictionary.txt":
+        return list(_default_corrector().dictionary)
+    return list(BrailleAutoCorrect(filename).dictionary)
 
-def suggest_word(input_word: str, dictionary: List[str], memory_file="memory.json") -> str:
+def suggest_word(input_word: str, dictionary: List[str], memory_file="memory.jsonl") -> str:
     """Backward compatibility function"""
-    corrector = BrailleAutoCorrect(memory_file=memory_file)
-    corrector.dictionary = dictionary
-    corrector._preprocess_dictionary()
-    
+    key = (id(dictionary), memory_file)
+    corrector = _suggest_corrector_cache.get(key)
+    # id() values can be recycled, so double-check the list is the same one
+    if corrector is None or corrector.dictionary is not dictionary:
+        corrector = BrailleAutoCorrect(memory_file=memory_file)
+        corrector.dictionary = dictionary
+        corrector._preprocess_dictionary()
+        _suggest_corrector_cache[key] = corrector
+
     suggestions = corrector.suggest_words(input_word, max_suggestions=1)
     if suggestions:
         best_word = suggestions[0][0]
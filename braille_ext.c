@@ -0,0 +1,196 @@
+/* Compiled edit-distance kernels for the braille auto-correct hot path.
+ *
+ * Exposes:
+ *   levenshtein(a, b, max_distance=-1)      -> int
+ *   batch_distances(q, seq, max_distance=-1) -> list[int]
+ *
+ * Arguments are byte strings (the encoded '0'/'1' braille patterns).
+ * max_distance < 0 means uncapped; capped calls return max_distance + 1
+ * as soon as the bound is provably exceeded, matching the Python side.
+ *
+ * Patterns up to 64 bytes run Myers' 1999 bit-parallel algorithm in a
+ * single machine word; longer ones fall back to a two-row DP with a
+ * row-minimum cut-off. Build with `python setup.py build_ext --inplace`.
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdint.h>
+#include <string.h>
+
+static long
+myers64(const unsigned char *p, Py_ssize_t n,
+        const unsigned char *t, Py_ssize_t m, long max_d)
+{
+    uint64_t Peq[256];
+    uint64_t VP, VN, X, D0, HN, HP, high;
+    long score;
+    Py_ssize_t i;
+
+    memset(Peq, 0, sizeof(Peq));
+    for (i = 0; i < n; i++)
+        Peq[p[i]] |= (uint64_t)1 << i;
+
+    VP = (n == 64) ? ~(uint64_t)0 : (((uint64_t)1 << n) - 1);
+    VN = 0;
+    score = (long)n;
+    high = (uint64_t)1 << (n - 1);
+
+    for (i = 0; i < m; i++) {
+        X = Peq[t[i]] | VN;
+        D0 = (((X & VP) + VP) ^ VP) | X;
+        HN = VP & D0;
+        HP = VN | ~(VP | D0);
+        if (HP & high)
+            score++;
+        else if (HN & high)
+            score--;
+        X = (HP << 1) | 1;
+        VN = X & D0;
+        VP = (HN << 1) | ~(X | D0);
+        /* score can drop by at most 1 per remaining character */
+        if (max_d >= 0 && score - (long)(m - 1 - i) > max_d)
+            return max_d + 1;
+    }
+    return score;
+}
+
+static long
+two_row_dp(const unsigned char *p, Py_ssize_t n,
+           const unsigned char *t, Py_ssize_t m, long max_d)
+{
+    long *buf, *prev, *cur, *tmp, cost, row_min;
+    Py_ssize_t i, j;
+
+    buf = (long *)PyMem_Malloc(2 * (size_t)(n + 1) * sizeof(long));
+    if (buf == NULL)
+        return -1;
+    prev = buf;
+    cur = buf + n + 1;
+
+    for (j = 0; j <= n; j++)
+        prev[j] = (long)j;
+    for (i = 1; i <= m; i++) {
+        cur[0] = (long)i;
+        row_min = cur[0];
+        for (j = 1; j <= n; j++) {
+            cost = prev[j - 1] + (p[j - 1] != t[i - 1]);
+            if (prev[j] + 1 < cost)
+                cost = prev[j] + 1;
+            if (cur[j - 1] + 1 < cost)
+                cost = cur[j - 1] + 1;
+            cur[j] = cost;
+            if (cost < row_min)
+                row_min = cost;
+        }
+        if (max_d >= 0 && row_min > max_d) {
+            PyMem_Free(buf);
+            return max_d + 1;
+        }
+        tmp = prev; prev = cur; cur = tmp;
+    }
+    cost = prev[n];
+    PyMem_Free(buf);
+    return cost;
+}
+
+static long
+distance(const unsigned char *a, Py_ssize_t la,
+         const unsigned char *b, Py_ssize_t lb, long max_d)
+{
+    /* pattern = shorter string */
+    if (la > lb) {
+        const unsigned char *ts = a; Py_ssize_t tl = la;
+        a = b; la = lb; b = ts; lb = tl;
+    }
+    if (max_d >= 0 && lb - la > max_d)
+        return max_d + 1;
+    if (la == lb && memcmp(a, b, (size_t)la) == 0)
+        return 0;
+    if (la == 0)
+        return (long)lb;
+    if (la <= 64)
+        return myers64(a, la, b, lb, max_d);
+    return two_row_dp(a, la, b, lb, max_d);
+}
+
+static PyObject *
+ext_levenshtein(PyObject *self, PyObject *args)
+{
+    const char *a, *b;
+    Py_ssize_t la, lb;
+    long max_d = -1, result;
+
+    if (!PyArg_ParseTuple(args, "y#y#|l", &a, &la, &b, &lb, &max_d))
+        return NULL;
+    result = distance((const unsigned char *)a, la,
+                      (const unsigned char *)b, lb, max_d);
+    if (result < 0)
+        return PyErr_NoMemory();
+    return PyLong_FromLong(result);
+}
+
+static PyObject *
+ext_batch_distances(PyObject *self, PyObject *args)
+{
+    const char *q;
+    Py_ssize_t qlen, count, i;
+    PyObject *seq, *fast, *item, *out, *val;
+    long max_d = -1, result;
+    char *cand;
+    Py_ssize_t clen;
+
+    if (!PyArg_ParseTuple(args, "y#O|l", &q, &qlen, &seq, &max_d))
+        return NULL;
+    fast = PySequence_Fast(seq, "batch_distances expects a sequence of bytes");
+    if (fast == NULL)
+        return NULL;
+    count = PySequence_Fast_GET_SIZE(fast);
+    out = PyList_New(count);
+    if (out == NULL) {
+        Py_DECREF(fast);
+        return NULL;
+    }
+    for (i = 0; i < count; i++) {
+        item = PySequence_Fast_GET_ITEM(fast, i);
+        if (PyBytes_AsStringAndSize(item, &cand, &clen) < 0) {
+            Py_DECREF(fast);
+            Py_DECREF(out);
+            return NULL;
+        }
+        result = distance((const unsigned char *)q, qlen,
+                          (const unsigned char *)cand, clen, max_d);
+        if (result < 0) {
+            Py_DECREF(fast);
+            Py_DECREF(out);
+            return PyErr_NoMemory();
+        }
+        val = PyLong_FromLong(result);
+        if (val == NULL) {
+            Py_DECREF(fast);
+            Py_DECREF(out);
+            return NULL;
+        }
+        PyList_SET_ITEM(out, i, val);
+    }
+    Py_DECREF(fast);
+    return out;
+}
+
+static PyMethodDef ext_methods[] = {
+    {"levenshtein", ext_levenshtein, METH_VARARGS,
+     "levenshtein(a, b, max_distance=-1) -> edit distance between byte strings"},
+    {"batch_distances", ext_batch_distances, METH_VARARGS,
+     "batch_distances(q, seq, max_distance=-1) -> list of distances from q"},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef ext_module = {
+    PyModuleDef_HEAD_INIT, "braille_ext",
+    "Bit-parallel edit-distance kernels", -1, ext_methods
+};
+
+PyMODINIT_FUNC
+PyInit_braille_ext(void)
+{
+    return PyModule_Create(&ext_module);
+}
@@ -5,13 +5,14 @@ Debug version to see what's happening with the suggestions
 
 from braille_autocorrect import BrailleAutoCorrect
 
-def debug_suggestion(input_word, expected_word=None):
+def debug_suggestion(input_word, expected_word=None, corrector=None):
     """Debug a specific suggestion to see what's happening"""
     print(f"\n🔍 DEBUGGING: '{input_word}' -> expected: '{expected_word}'")
     print("=" * 50)
-    
-    corrector = BrailleAutoCorrect()
-    
+
+    if corrector is None:
+        corrector = BrailleAutoCorrect()
+
     # Show input braille pattern
     input_braille = corrector.word_to_braille(input_word)
     print(f"Input '{input_word}' -> Braille: {input_braille}")
@@ -59,12 +60,15 @@ def test_all_examples():
     
     print("🧪 TESTING ALL EXAMPLES FROM DOCUMENTATION")
     print("=" * 60)
-    
+
+    # One corrector for the whole run: preprocessing the dictionary per
+    # example only slows the debug loop down
+    corrector = BrailleAutoCorrect()
+
     for input_word, expected in examples:
-        debug_suggestion(input_word, expected)
-        
+        debug_suggestion(input_word, expected, corrector)
+
         # Quick test
-        corrector = BrailleAutoCorrect()
         suggestions = corrector.suggest_words(input_word, max_suggestions=1)
         actual = suggestions[0][0] if suggestions else "NO_SUGGESTION"
         
@@ -82,7 +86,7 @@ def show_braille_mappings():
     # Show mappings for letters in our test words
     test_chars = set('cakdghellobat')
     for char in sorted(test_chars):
-        braille = corrector.braille_map.get(char, '000000')
+        braille = format(corrector.braille_map.get(char, 0), '06b')
         print(f"'{char}' -> {braille}")
     
     print("\n🔤 WORD -> BRAILLE CONVERSIONS")
@@ -0,0 +1,37 @@
+"""Gunicorn hooks that share the dictionary scan buffer across workers.
+
+Each worker builds its own BrailleAutoCorrect, so under --workers=N the
+flat uint8 dictionary buffer would be duplicated N times. The master
+builds it once here and publishes it in a shared-memory block; workers
+see its name through the environment and attach instead of keeping a
+private copy (see _preprocess_dictionary). The block is created at
+config import time because gunicorn preloads the app before firing
+on_starting — the name must be in the environment before any corrector
+is constructed. Run with:
+
+    gunicorn -c gunicorn_conf.py --workers=$(nproc) --threads=4 --preload wsgi:app
+"""
+import os
+
+try:
+    import numpy as np
+    from multiprocessing import shared_memory
+except ImportError:
+    np = None
+
+_shm = None
+
+if np is not None:
+    from braille_autocorrect import BrailleAutoCorrect
+
+    _buf = BrailleAutoCorrect()._dict_bytes
+    _shm = shared_memory.SharedMemory(create=True, size=_buf.nbytes)
+    _shm.buf[:_buf.nbytes] = _buf.tobytes()
+    os.environ["BRAILLE_DICT_SHM"] = _shm.name
+    del _buf
+
+
+def on_exit(server):
+    if _shm is not None:
+        _shm.close()
+        _shm.unlink()
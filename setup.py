@@ -0,0 +1,17 @@
+from setuptools import setup, Extension
+
+# The extension is optional: braille_autocorrect falls back to its pure
+# Python kernels when braille_ext has not been built. Build in place with
+#   python setup.py build_ext --inplace
+setup(
+    name="braille-autocorrect",
+    version="1.0",
+    py_modules=["braille_autocorrect"],
+    ext_modules=[
+        Extension(
+            "braille_ext",
+            sources=["braille_ext.c"],
+            extra_compile_args=["-O3"],
+        )
+    ],
+)
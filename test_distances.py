@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Cross-checks for the distance kernels and search indexes.
+
+Every fast path (bit-parallel Myers, the optional C extension and numba
+kernels, the DAWG walk, the BK-tree) is compared against a plain
+reference DP on randomized inputs, with and without distance caps, and
+the scan backends are checked for identical suggestions. Runs with no
+arguments and exits non-zero on the first failure.
+"""
+
+import random
+import sys
+
+import braille_autocorrect as ba
+from braille_autocorrect import BrailleAutoCorrect, _lev_py, _POPCOUNT6
+
+LETTERS = 'abcdefghijklmnopqrstuvwxyz'
+random.seed(20240830)
+
+
+def reference_levenshtein(a, b):
+    """Textbook full-matrix unit-cost DP"""
+    n, m = len(a), len(b)
+    prev = list(range(n + 1))
+    for i in range(1, m + 1):
+        cur = [i] + [0] * n
+        for j in range(1, n + 1):
+            cur[j] = min(prev[j - 1] + (a[j - 1] != b[i - 1]),
+                         prev[j] + 1, cur[j - 1] + 1)
+        prev = cur
+    return prev[n]
+
+
+def reference_weighted(p1, p2):
+    """Textbook full-matrix DP with dot-count substitution costs"""
+    n, m = len(p1), len(p2)
+    prev = [6 * j for j in range(n + 1)]
+    for i in range(1, m + 1):
+        cur = [6 * i] + [0] * n
+        for j in range(1, n + 1):
+            cur[j] = min(prev[j - 1] + _POPCOUNT6[p1[j - 1] ^ p2[i - 1]],
+                         prev[j] + 6, cur[j - 1] + 6)
+        prev = cur
+    return prev[n]
+
+
+def random_pattern(max_len=20):
+    return ''.join(random.choice('01') for _ in range(random.randint(0, max_len)))
+
+
+def random_word(max_len=8):
+    return ''.join(random.choice(LETTERS) for _ in range(random.randint(1, max_len)))
+
+
+def check(condition, message):
+    if not condition:
+        print(f"❌ FAIL: {message}")
+        sys.exit(1)
+
+
+def capped(reference, max_distance):
+    """What a capped kernel must return given the true distance"""
+    return reference if reference <= max_distance else max_distance + 1
+
+
+def test_string_kernels(corrector, rounds=2000):
+    """levenshtein_optimized, _lev_py and braille_ext vs the reference DP"""
+    print("=" * 60)
+    print("STRING DISTANCE KERNELS vs REFERENCE DP")
+    print("=" * 60)
+
+    for _ in range(rounds):
+        a, b = random_pattern(), random_pattern()
+        want = reference_levenshtein(a, b)
+        check(_lev_py(a, b) == want, f"_lev_py({a!r}, {b!r})")
+        check(corrector.levenshtein_optimized(a, b) == want,
+              f"levenshtein_optimized({a!r}, {b!r})")
+        k = random.randint(0, 6)
+        check(_lev_py(a, b, k) == capped(want, k), f"_lev_py cap {k}")
+        check(corrector.levenshtein_optimized(a, b, k) == capped(want, k),
+              f"levenshtein_optimized cap {k}")
+    print(f"✅ pure Python and dispatch paths agree on {rounds} random pairs")
+
+    if ba._braille_ext is None:
+        print("⚠️  braille_ext not built; skipping C kernel checks")
+        return
+    pairs = [(random_pattern(80), random_pattern(80)) for _ in range(rounds)]
+    for a, b in pairs:
+        want = reference_levenshtein(a, b)
+        check(ba._braille_ext.levenshtein(a.encode(), b.encode()) == want,
+              f"braille_ext.levenshtein({a!r}, {b!r})")
+        k = random.randint(0, 6)
+        check(ba._braille_ext.levenshtein(a.encode(), b.encode(), k) == capped(want, k),
+              f"braille_ext.levenshtein cap {k}")
+    q = random_pattern(30)
+    cands = [b.encode() for _, b in pairs[:200]]
+    got = ba._braille_ext.batch_distances(q.encode(), cands, 8)
+    want = [capped(reference_levenshtein(q, c.decode()), 8) for c in cands]
+    check(got == want, "braille_ext.batch_distances")
+    print(f"✅ C kernels agree on {rounds} pairs (incl. >64-char fallback) and one batch")
+
+
+def test_weighted_metric(corrector, rounds=1500):
+    """levenshtein_weighted vs the reference DP, plus metric axioms"""
+    print("\n" + "=" * 60)
+    print("WEIGHTED LETTER METRIC vs REFERENCE DP")
+    print("=" * 60)
+
+    for _ in range(rounds):
+        w1, w2, w3 = random_word(), random_word(), random_word()
+        p1 = corrector._word_patterns(w1)
+        p2 = corrector._word_patterns(w2)
+        want = reference_weighted(p1, p2)
+        check(corrector.levenshtein_weighted(w1, w2) == want,
+              f"levenshtein_weighted({w1!r}, {w2!r})")
+        k = random.randint(0, 20)
+        got = corrector.levenshtein_weighted(w1, w2, k)
+        check(got == want if want <= k else got > k,
+              f"levenshtein_weighted cap {k} on ({w1!r}, {w2!r})")
+        # Metric axioms: symmetry and the triangle inequality
+        check(want == reference_weighted(p2, p1), f"symmetry ({w1!r}, {w2!r})")
+        d13 = corrector.levenshtein_weighted(w1, w3)
+        d32 = corrector.levenshtein_weighted(w3, w2)
+        check(want <= d13 + d32, f"triangle ({w1!r}, {w2!r}, {w3!r})")
+    print(f"✅ weighted distance exact and metric axioms hold on {rounds} triples")
+
+
+def test_search_indexes(corrector, rounds=300):
+    """_dawg_search and _bk_nearest vs brute force over the dictionary"""
+    print("\n" + "=" * 60)
+    print("DAWG AND BK-TREE SEARCH vs BRUTE FORCE")
+    print("=" * 60)
+
+    words = sorted(set(corrector.dictionary))
+    for _ in range(rounds):
+        query = random_word()
+        braille = corrector.word_to_braille(query)
+        brute = {w: reference_levenshtein(braille, corrector.braille_words[w])
+                 for w in words}
+        k = random.randint(0, 8)
+        got = sorted(corrector._dawg_search(query, k))
+        want = sorted((w, d) for w, d in brute.items() if d <= k)
+        check(got == want, f"_dawg_search({query!r}, {k})")
+        top = random.randint(1, 3)
+        got_k = sorted(d for _, d in corrector._dawg_search(query, k, top))[:top]
+        want_k = sorted(d for _, d in want)[:top]
+        check(got_k == want_k, f"_dawg_search top-{top} ({query!r}, {k})")
+        _, nearest = corrector._bk_nearest(query)
+        check(nearest == min(brute.values()), f"_bk_nearest({query!r})")
+    print(f"✅ DAWG (full and top-k) and BK-tree match brute force on {rounds} queries")
+
+
+def test_backend_parity():
+    """Every available scan backend returns identical suggestions.
+
+    _suggest_impl picks the first available backend in a fixed order
+    (rapidfuzz, C extension, numba, process pool, DAWG), so each labeled
+    configuration disables every backend ahead of the one under test —
+    otherwise the checks would silently all exercise whichever backend
+    ranks first on this machine.
+    """
+    print("\n" + "=" * 60)
+    print("SCAN BACKEND PARITY")
+    print("=" * 60)
+
+    queries = ['cn', 'cak', 'dg', 'cann', 'baat', 'helllo', 'hoppe', 'xyz', 'q']
+    # name -> (required gate, gates to disable, parallel-scan threshold)
+    configs = [
+        ('rapidfuzz', ba._rf_process if ba.np is not None else None,
+         (), ba._PARALLEL_SCAN_THRESHOLD),
+        ('braille_ext', ba._braille_ext,
+         ('_rf_process',), ba._PARALLEL_SCAN_THRESHOLD),
+        ('numba', ba._bulk_lev_nb,
+         ('_rf_process', '_braille_ext'), ba._PARALLEL_SCAN_THRESHOLD),
+        ('process_pool', True,
+         ('_rf_process', '_braille_ext', '_bulk_lev_nb'), 1),
+        ('dawg', True,
+         ('_rf_process', '_braille_ext', '_bulk_lev_nb'),
+         ba._PARALLEL_SCAN_THRESHOLD),
+    ]
+
+    saved = {name: getattr(ba, name)
+             for name in ('_rf_process', '_braille_ext', '_bulk_lev_nb',
+                          '_PARALLEL_SCAN_THRESHOLD')}
+    results = {}
+    try:
+        for name, available, disabled, threshold in configs:
+            if available is None:
+                print(f"⚠️  {name} backend unavailable; skipped")
+                continue
+            for gate in saved:
+                setattr(ba, gate, saved[gate])
+            for gate in disabled:
+                setattr(ba, gate, None)
+            ba._PARALLEL_SCAN_THRESHOLD = threshold
+            c = BrailleAutoCorrect()
+            results[name] = [c.suggest_words(q, 5) for q in queries]
+    finally:
+        for gate, value in saved.items():
+            setattr(ba, gate, value)
+
+    baseline_name, baseline = next(iter(results.items()))
+    for name, res in results.items():
+        check(res == baseline, f"{name} backend disagrees with {baseline_name}")
+    print(f"✅ backends agree: {', '.join(results)}")
+
+
+def main():
+    print("🔬 DISTANCE KERNEL CROSS-CHECKS")
+    print("Randomized comparison of every kernel against a reference DP\n")
+
+    corrector = BrailleAutoCorrect()
+    test_string_kernels(corrector)
+    test_weighted_metric(corrector)
+    test_search_indexes(corrector)
+    test_backend_parity()
+
+    print("\n🎉 All distance cross-checks passed")
+
+
+if __name__ == "__main__":
+    main()
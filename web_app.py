@@ -29,34 +29,52 @@
 #     app.run(debug=True)
 
 
-from flask import Flask, render_template_string, request, jsonify
+from flask import Flask, Response, request, jsonify, make_response
 from braille_autocorrect import BrailleAutoCorrect
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import gzip
+import os
 import time
 
+try:
+    import orjson  # optional: ~2-5x faster JSON encoding than stdlib
+except ImportError:
+    orjson = None
+
 app = Flask(__name__)
+# Static assets (the stylesheet) are immutable between deploys; let
+# browsers cache them for a day instead of refetching per visit.
+app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 86400
+
+# API work runs off the request thread; the distance kernels (C extension,
+# rapidfuzz) release the GIL, so a thread pool scales across cores without
+# duplicating the dictionary the way a process pool would.
+_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+# Input bounds: a huge word means a huge DP per dictionary entry, so cap
+# request size rather than pay pathological latency. 64 letters is far
+# beyond any real word and keeps the scan cost bounded.
+_MAX_WORD_LEN = 64
+_MAX_SUGGESTIONS = 50
 
 # Initialize the enhanced corrector
 corrector = BrailleAutoCorrect()
 
+@functools.lru_cache(maxsize=8192)
+def _cached_suggest(word, k, max_distance=None):
+    """Memoized suggest_words: repeat queries (resubmits, common short
+    tokens) skip the distance scan entirely. Cleared on every learned
+    correction so new corrections are never masked by stale entries."""
+    return tuple(corrector.suggest_words(word, max_suggestions=k,
+                                         max_distance=max_distance))
+
 TEMPLATE = """
 <!doctype html>
 <html>
 <head>
     <title>Enhanced Braille Auto-Correct</title>
-    <style>
-        body { font-family: Arial, sans-serif; max-width: 800px; margin: 50px auto; padding: 20px; }
-        .container { background: #f5f5f5; padding: 30px; border-radius: 10px; }
-        input[type="text"] { width: 300px; padding: 10px; font-size: 16px; border: 2px solid #ddd; border-radius: 5px; }
-        input[type="submit"] { padding: 10px 20px; font-size: 16px; background: #007bff; color: white; border: none; border-radius: 5px; cursor: pointer; margin-left: 10px; }
-        input[type="submit"]:hover { background: #0056b3; }
-        .suggestions { margin-top: 20px; }
-        .suggestion-item { background: white; padding: 15px; margin: 10px 0; border-radius: 5px; border-left: 4px solid #007bff; }
-        .confidence { color: #666; font-size: 0.9em; }
-        .stats { background: #e9ecef; padding: 15px; border-radius: 5px; margin-top: 20px; }
-        .learning-section { margin-top: 20px; padding: 15px; background: #d4edda; border-radius: 5px; }
-        .processing-time { color: #28a745; font-weight: bold; }
-        .error { color: #dc3545; }
-    </style>
+    <link rel="stylesheet" href="{{ url_for('static', filename='app.css') }}">
 </head>
 <body>
     <div class="container">
@@ -121,54 +139,124 @@ TEMPLATE = """
 </html>
 """
 
+# The template is a constant, so compile it once at import instead of
+# handing the string to render_template_string on every request. Using the
+# app's Jinja environment keeps Flask's template globals available.
+_TPL = app.jinja_env.from_string(TEMPLATE)
+
+# Pre-rendered GET / page: (etag, html bytes, gzipped bytes). Rebuilt
+# lazily whenever the stats-derived etag moves (i.e. after a learned
+# correction), so the common case is serving a preformed buffer.
+_home_cache = (None, b"", None)
+
+def _home_page():
+    global _home_cache
+    stats = corrector.get_stats()
+    etag = 'W/"{}-{}-{}"'.format(stats["dictionary_size"],
+                                 stats["learned_corrections"],
+                                 stats["braille_patterns_cached"])
+    if _home_cache[0] != etag:
+        html = _TPL.render(suggestions=None, input_word=None,
+                           processing_time=0, stats=stats).encode()
+        _home_cache = (etag, html, gzip.compress(html, 9))
+    return _home_cache
+
 @app.route("/", methods=["GET", "POST"])
 def home():
     suggestions = None
     input_word = None
     processing_time = 0
-    
+
+    if request.method == "GET":
+        # The plain GET page only varies with the stats block, so revisits
+        # can skip the render and the body bytes entirely via ETag/304, and
+        # everyone else gets a pre-rendered (and pre-gzipped) byte buffer.
+        etag, html, gz = _home_page()
+        if request.headers.get("If-None-Match") == etag:
+            return "", 304
+        if gz is not None and "gzip" in request.headers.get("Accept-Encoding", ""):
+            resp = make_response(gz)
+            resp.headers["Content-Encoding"] = "gzip"
+        else:
+            resp = make_response(html)
+        resp.headers["Content-Type"] = "text/html; charset=utf-8"
+        resp.headers["ETag"] = etag
+        resp.headers["Cache-Control"] = "private, must-revalidate"
+        resp.headers["Vary"] = "Accept-Encoding"
+        return resp
+
     if request.method == "POST":
-        input_word = request.form.get("word", "").strip()
-        
+        form = request.form  # parse the body once, not per field
+        input_word = form.get("word", "").strip()
+        if len(input_word) > _MAX_WORD_LEN:
+            return "word too long", 413
+
         # Handle learning confirmation
-        if request.form.get("learn") == "true":
-            confirm_word = request.form.get("confirm_word")
+        if form.get("learn") == "true":
+            confirm_word = form.get("confirm_word")
             if input_word and confirm_word:
                 corrector.remember_choice(input_word, confirm_word)
+                _cached_suggest.cache_clear()
                 # Show a success message by redirecting with the same word
                 input_word = input_word  # Keep the input for display
-        
+
         if input_word:
-            start_time = time.time()
-            suggestion_results = corrector.suggest_words(input_word, max_suggestions=5)
-            end_time = time.time()
-            
-            processing_time = round((end_time - start_time) * 1000, 1)
+            start_ns = time.perf_counter_ns()
+            suggestion_results = _cached_suggest(input_word, 5)
+            # One-decimal milliseconds via integer ops; perf_counter_ns is
+            # monotonic and finer-grained than time.time()
+            processing_time = (time.perf_counter_ns() - start_ns) // 100_000 / 10
             suggestions = suggestion_results if suggestion_results else None
     
     stats = corrector.get_stats()
     
-    return render_template_string(
-        TEMPLATE, 
-        suggestions=suggestions, 
+    return _TPL.render(
+        suggestions=suggestions,
         input_word=input_word,
         processing_time=processing_time,
         stats=stats
     )
 
+def _parse_json_body():
+    """Decode the request body, preferring orjson's fast path.
+
+    Returns None on malformed JSON; skipping werkzeug's mimetype checks is
+    fine for these endpoints, which only ever accept JSON anyway.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(request.get_data(cache=False))
+        except orjson.JSONDecodeError:
+            return None
+    return request.get_json(silent=True)
+
 @app.route("/api/suggest", methods=["POST"])
 def api_suggest():
     """API endpoint for programmatic access"""
-    data = request.get_json()
-    if not data or 'word' not in data:
+    data = _parse_json_body()
+    if not isinstance(data, dict) or 'word' not in data:
         return jsonify({"error": "Missing 'word' parameter"}), 400
     
     input_word = data['word'].strip()
+    if len(input_word) > _MAX_WORD_LEN:
+        return jsonify({"error": "word too long"}), 413
     max_suggestions = data.get('max_suggestions', 5)
-    
-    start_time = time.time()
-    suggestions = corrector.suggest_words(input_word, max_suggestions=max_suggestions)
-    end_time = time.time()
+    if not isinstance(max_suggestions, int) or isinstance(max_suggestions, bool) \
+            or max_suggestions < 1:
+        return jsonify({"error": "max_suggestions must be a positive integer"}), 400
+    max_suggestions = min(max_suggestions, _MAX_SUGGESTIONS)
+    # Optional distance cap: a tight bound lets the kernels stay inside the
+    # Ukkonen band and reject most candidates after a handful of cells.
+    max_distance = data.get('max_distance')
+    if max_distance is not None and (not isinstance(max_distance, int)
+                                     or isinstance(max_distance, bool)
+                                     or max_distance < 0):
+        return jsonify({"error": "max_distance must be a non-negative integer"}), 400
+
+    start_ns = time.perf_counter_ns()
+    suggestions = _POOL.submit(_cached_suggest, input_word, max_suggestions,
+                               max_distance).result()
+    elapsed_ns = time.perf_counter_ns() - start_ns
     
     result = {
         "input": input_word,
@@ -180,20 +268,24 @@ def api_suggest():
             }
             for word, distance, confidence in suggestions
         ],
-        "processing_time_ms": round((end_time - start_time) * 1000, 1),
+        "processing_time_ms": elapsed_ns // 100_000 / 10,
+        "processing_time_ns": elapsed_ns,
         "stats": corrector.get_stats()
     }
-    
+
+    if orjson is not None:
+        return Response(orjson.dumps(result), mimetype="application/json")
     return jsonify(result)
 
 @app.route("/api/learn", methods=["POST"])
 def api_learn():
     """API endpoint to add user corrections"""
-    data = request.get_json()
-    if not data or 'typed' not in data or 'corrected' not in data:
+    data = _parse_json_body()
+    if not isinstance(data, dict) or 'typed' not in data or 'corrected' not in data:
         return jsonify({"error": "Missing 'typed' or 'corrected' parameters"}), 400
     
     corrector.remember_choice(data['typed'], data['corrected'])
+    _cached_suggest.cache_clear()
     return jsonify({"success": True, "message": "Correction learned successfully"})
 
 if __name__ == "__main__":
@@ -206,5 +298,8 @@ if __name__ == "__main__":
     print("\nWeb Interface: http://127.0.0.1:5000")
     print("API Example: POST to /api/suggest with JSON: {'word': 'cak'}")
     print("Learning API: POST to /api/learn with JSON: {'typed': 'cak', 'corrected': 'cap'}")
-    
-    app.run(debug=True)
\ No newline at end of file
+
+    # The werkzeug dev server is single-threaded and the reloader re-imports
+    # on every change; keep debug behind an env var and use gunicorn (see
+    # wsgi.py) for anything beyond local development.
+    app.run(debug=bool(os.getenv("BRAILLE_DEV")))
\ No newline at end of file
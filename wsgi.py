@@ -0,0 +1,9 @@
+"""WSGI entry point for production servers.
+
+    gunicorn -c gunicorn_conf.py --workers=$(nproc) --threads=4 --preload wsgi:app
+
+--preload imports this module (and so builds the corrector) once in the
+master before forking, so workers share the dictionary pages copy-on-write;
+gunicorn_conf.py additionally publishes the scan buffer in shared memory.
+"""
+from web_app import app  # noqa: F401